@@ -0,0 +1,31 @@
+"""Add index on gw_alerts triggerId and reception_count
+
+Revision ID: 3f5c9a1d7e2b
+Revises: 682e0124e66b
+Create Date: 2026-10-16 17:05:12.318204
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f5c9a1d7e2b"
+down_revision: str | Sequence[str] | None = "682e0124e66b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_gw_alerts_triggerId_reception_count",
+        "gw_alerts",
+        ["triggerId", "reception_count"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_gw_alerts_triggerId_reception_count", table_name="gw_alerts")
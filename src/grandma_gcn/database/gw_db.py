@@ -1,6 +1,6 @@
 from typing import Self
 
-from sqlalchemy import JSON, Boolean, Column, Integer, String, desc
+from sqlalchemy import JSON, Boolean, Column, Index, Integer, String, desc
 from sqlalchemy.orm import Session
 
 from grandma_gcn.database.base import Base
@@ -8,6 +8,10 @@ from grandma_gcn.database.base import Base
 
 class GW_alert(Base):
     __tablename__ = "gw_alerts"
+    # get_last_by_trigger_id: filter on triggerId, latest reception first
+    __table_args__ = (
+        Index("ix_gw_alerts_triggerId_reception_count", "triggerId", "reception_count"),
+    )
 
     id_gw = Column(Integer, primary_key=True, autoincrement=True)
     triggerId = Column(String)
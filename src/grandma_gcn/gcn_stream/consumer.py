@@ -21,6 +21,16 @@ from grandma_gcn.slackbot.gw_message import (
 )
 from grandma_gcn.worker.owncloud_client import OwncloudClient
 
+# Defaults of the Kafka consumer configuration, overridden by the KAFKA_CONFIG
+# section of the configuration file. The offsets are committed by start_poll_loop
+# once an alert is processed, librdkafka must not commit them on its own.
+# The GW notices embed their skymap and weigh up to a few MB, a 5 MB fetch
+# size brings a burst of notices in one fetch request instead of one per notice.
+KAFKA_CONSUMER_DEFAULTS = {
+    "enable.auto.commit": False,
+    "fetch.message.max.bytes": 5 * 1024 * 1024,
+}
+
 
 class Consumer(KafkaConsumer):
     def __init__(self, gcn_stream, logger: LoggerNewLine) -> None:
@@ -28,12 +38,15 @@ class Consumer(KafkaConsumer):
         self.logger.info("Starting GCN stream consumer")
 
         super().__init__(
-            config=gcn_stream.gcn_config["KAFKA_CONFIG"],
+            config=KAFKA_CONSUMER_DEFAULTS | gcn_stream.gcn_config["KAFKA_CONFIG"],
             client_id=gcn_stream.gcn_config["CLIENT"]["id"],
             client_secret=gcn_stream.gcn_config["CLIENT"]["secret"],
         )
 
         self.owncloud_client = OwncloudClient(gcn_stream.gcn_config.get("OWNCLOUD"))
+        # ownCloud alert folders already created by this consumer, the next
+        # receptions of the same event only need their own GWEMOPT subfolder
+        self._owncloud_alert_folders: set[str] = set()
 
         self.gcn_stream = gcn_stream
 
@@ -87,21 +100,39 @@ class Consumer(KafkaConsumer):
         tuple[str, URL]: The path to the alert folder on ownCloud and the URL of the alert folder.
         """
         path_gw_alert = f"Candidates/GW/{gw_alert.event_id}"
-        # create a new folder on ownCloud for this alert
-        path_owncloud_gw = self.owncloud_client.mkdir(path_gw_alert)
-
-        self.logger.info(f"Folder {path_owncloud_gw} successfully created on ownCloud")
         path_gwemopt = path_gw_alert + "/GWEMOPT"
-        path_images = path_gw_alert + "/IMAGES"
-        path_knc_images = path_gw_alert + "/KNC_IMAGES"
-        path_logbook = path_gw_alert + "/LOGBOOK"
-        path_voevents = path_gw_alert + "/VOEVENTS"
 
-        # create subfolders for gwemopt, images, knc_images, logbook and voevents
-        path_owncloud_gwemopt = self.owncloud_client.mkdir(path_gwemopt)
-        self.logger.info(
-            f"Folder {path_owncloud_gwemopt} successfully created on ownCloud"
-        )
+        if path_gw_alert in self._owncloud_alert_folders:
+            self.logger.info(f"Folder {path_gw_alert} already created on ownCloud")
+        else:
+            # create a new folder on ownCloud for this alert
+            path_owncloud_gw = self.owncloud_client.mkdir(path_gw_alert)
+
+            self.logger.info(
+                f"Folder {path_owncloud_gw} successfully created on ownCloud"
+            )
+            path_images = path_gw_alert + "/IMAGES"
+            path_knc_images = path_gw_alert + "/KNC_IMAGES"
+            path_logbook = path_gw_alert + "/LOGBOOK"
+            path_voevents = path_gw_alert + "/VOEVENTS"
+
+            # create subfolders for gwemopt, images, knc_images, logbook and voevents,
+            # they only depend on the alert folder
+            for path_owncloud_subfolder in self.owncloud_client.mkdir_many(
+                [
+                    path_gwemopt,
+                    path_images,
+                    path_knc_images,
+                    path_logbook,
+                    path_voevents,
+                ]
+            ):
+                self.logger.info(
+                    f"Folder {path_owncloud_subfolder} successfully created on ownCloud"
+                )
+            # mkdir and mkdir_many raise if a folder can't be created, the alert
+            # folder is only cached once it exists with all its subfolders
+            self._owncloud_alert_folders.add(path_gw_alert)
 
         # create subfolder for the alert type where the gwemopt products will be stored
         path_alert = path_gwemopt + f"/{gw_alert.event_type.value}_{uuid.uuid4().hex}"
@@ -110,23 +141,6 @@ class Consumer(KafkaConsumer):
             f"Folder {url_owncloud_alert} successfully created on ownCloud"
         )
 
-        path_owncloud_images = self.owncloud_client.mkdir(path_images)
-        self.logger.info(
-            f"Folder {path_owncloud_images} successfully created on ownCloud"
-        )
-        path_owncloud_knc_images = self.owncloud_client.mkdir(path_knc_images)
-        self.logger.info(
-            f"Folder {path_owncloud_knc_images} successfully created on ownCloud"
-        )
-        path_owncloud_logbook = self.owncloud_client.mkdir(path_logbook)
-        self.logger.info(
-            f"Folder {path_owncloud_logbook} successfully created on ownCloud"
-        )
-        path_owncloud_voevents = self.owncloud_client.mkdir(path_voevents)
-        self.logger.info(
-            f"Folder {path_owncloud_voevents} successfully created on ownCloud"
-        )
-
         return path_gw_alert, url_owncloud_alert
 
     def process_alert(self, notice: bytes, topic: str) -> None:
@@ -843,7 +857,10 @@ class Consumer(KafkaConsumer):
         return grb_alert_db
 
     def start_poll_loop(
-        self, interval_between_polls: int = 1, max_retries: int = 120
+        self,
+        interval_between_polls: int = 1,
+        max_retries: int = 120,
+        max_empty_polls: int | None = None,
     ) -> None:
         """
         Poll for messages from the Kafka stream with a timeout. The maximum duration of the polling is defined by the
@@ -852,16 +869,24 @@ class Consumer(KafkaConsumer):
         Args:
             interval_between_polls (int, optional): Interval between polling attempts. Defaults to 1.
             max_retries (int, optional): Maximum number of polling attempts. Defaults to 120.
+            max_empty_polls (int | None, optional): Stop the polling after this number of consecutive polls
+                without message. Defaults to None, poll max_retries times.
         """
+        nb_empty_polls = 0
         for _ in range(max_retries):
             message = self.poll(timeout=interval_between_polls)
-            if message is not None:
-                if message.error():
-                    self.logger.error(message.error())
-                    continue
-                try:
-                    self.process_alert(notice=message.value(), topic=message.topic())
-                    self.commit(message)
-                except Exception as err:
-                    self.logger.error(err)
-                    raise err
+            if message is None:
+                nb_empty_polls += 1
+                if max_empty_polls is not None and nb_empty_polls >= max_empty_polls:
+                    break
+                continue
+            nb_empty_polls = 0
+            if message.error():
+                self.logger.error(message.error())
+                continue
+            try:
+                self.process_alert(notice=message.value(), topic=message.topic())
+                self.commit(message)
+            except Exception as err:
+                self.logger.error(err)
+                raise err
@@ -1,5 +1,6 @@
 import logging
 from enum import Enum
+from functools import cached_property
 from typing import Self
 
 import voeventparse as vp
@@ -61,6 +62,32 @@ class GRB_alert:
         mission = Mission(db_model.mission) if db_model.mission else Mission.UNKNOWN
         return cls(db_model.xml_payload.encode("utf-8"), mission)
 
+    @cached_property
+    def _top_params(self) -> dict:
+        """
+        Top-level parameters of the VOEvent, extracted once per alert
+        and shared by all the properties reading them.
+
+        Returns
+        -------
+        dict
+            The top-level parameters, keyed by parameter name
+        """
+        return vp.get_toplevel_params(self.voevent)
+
+    @cached_property
+    def _grouped_params(self) -> dict:
+        """
+        Grouped parameters of the VOEvent, extracted once per alert
+        and shared by all the properties reading them.
+
+        Returns
+        -------
+        dict
+            The parameters of each group, keyed by group name
+        """
+        return vp.get_grouped_params(self.voevent)
+
     @property
     def trigger_id(self) -> str:
         """
@@ -74,14 +101,14 @@ class GRB_alert:
             The trigger ID
         """
         try:
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
 
             # Try TrigID first (Swift)
             if "TrigID" in top_params:
                 return str(top_params["TrigID"]["value"])
 
             # Try grouped params (SVOM has Burst_Id in Svom_Identifiers group)
-            grouped_params = vp.get_grouped_params(self.voevent)
+            grouped_params = self._grouped_params
             if "Svom_Identifiers" in grouped_params:
                 svom_ids = grouped_params["Svom_Identifiers"]
                 if "Burst_Id" in svom_ids:
@@ -233,7 +260,7 @@ class GRB_alert:
             The packet type number, or None if not found
         """
         try:
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
             if "Packet_Type" in top_params:
                 return int(top_params["Packet_Type"]["value"])
             return None
@@ -315,7 +342,7 @@ class GRB_alert:
             Slew status ("accepted", "rejected", etc.) or None if not found
         """
         try:
-            grouped_params = vp.get_grouped_params(self.voevent)
+            grouped_params = self._grouped_params
             if "Satellite_Info" in grouped_params:
                 sat_info = grouped_params["Satellite_Info"]
                 if "Slew_Status" in sat_info:
@@ -338,7 +365,7 @@ class GRB_alert:
             Rate significance value with unit (e.g., "22.0 sigma") or "NA"
         """
         try:
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
             if "Rate_Signif" in top_params:
                 value = float(top_params["Rate_Signif"]["value"])
                 unit = top_params["Rate_Signif"].get("unit", "")
@@ -346,7 +373,7 @@ class GRB_alert:
                 return f"{formatted_value} {unit}".strip() if unit else formatted_value
 
             # For SVOM: check Detection_Info group
-            grouped_params = vp.get_grouped_params(self.voevent)
+            grouped_params = self._grouped_params
             if "Detection_Info" in grouped_params:
                 det_info = grouped_params["Detection_Info"]
                 # If Trigger_Type is CRT, then SNR is rate_signif
@@ -382,7 +409,7 @@ class GRB_alert:
             Image significance value with unit (e.g., "8.6 sigma") or "NA"
         """
         try:
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
             if "Image_Signif" in top_params:
                 value = float(top_params["Image_Signif"]["value"])
                 unit = top_params["Image_Signif"].get("unit", "")
@@ -390,7 +417,7 @@ class GRB_alert:
                 return f"{formatted_value} {unit}".strip() if unit else formatted_value
 
             # For SVOM: check Detection_Info group
-            grouped_params = vp.get_grouped_params(self.voevent)
+            grouped_params = self._grouped_params
             if "Detection_Info" in grouped_params:
                 det_info = grouped_params["Detection_Info"]
                 # If Trigger_Type is IMT, then SNR is image_signif
@@ -427,7 +454,7 @@ class GRB_alert:
         """
         try:
             # For SVOM: check Detection_Info group for Timescale
-            grouped_params = vp.get_grouped_params(self.voevent)
+            grouped_params = self._grouped_params
             if "Detection_Info" in grouped_params:
                 det_info = grouped_params["Detection_Info"]
                 if "Timescale" in det_info:
@@ -436,7 +463,7 @@ class GRB_alert:
                     return f"{value:.1f} {unit}"
 
             # For Swift: check for duration-related parameters
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
             if "Integ_Time" in top_params:
                 value = float(top_params["Integ_Time"]["value"])
                 unit = top_params["Integ_Time"].get("unit", "s")
@@ -459,7 +486,7 @@ class GRB_alert:
             Burst magnitude or None if not available
         """
         try:
-            top_params = vp.get_toplevel_params(self.voevent)
+            top_params = self._top_params
             if "Burst_Mag" in top_params:
                 return float(top_params["Burst_Mag"]["value"]) / 100
             return None
@@ -5,6 +5,7 @@ import logging
 import uuid
 from base64 import b64decode
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Self
 
@@ -43,7 +44,7 @@ def bytes_to_dict(notice: bytes) -> dict:
     dict
         the notice dictionary
     """
-    return json.load(io.BytesIO(notice))
+    return json.loads(notice)
 
 
 def save_as_json(dict_notice: dict, save_path: Path) -> None:
@@ -58,13 +59,18 @@ def save_as_json(dict_notice: dict, save_path: Path) -> None:
     save_path : Path
         The path where to save the dictionary
     """
-    with open(save_path, "w") as fp:
-        json.dump(dict_notice, fp)
+    # json.dumps encodes in one pass with the C encoder, json.dump goes through
+    # the pure python encoder to write the skymap string chunk by chunk
+    save_path.write_text(json.dumps(dict_notice))
 
 
 class GW_alert:
-    def __init__(self, notice: bytes, thresholds: dict[str, float | int]) -> None:
-        self.gw_dict = bytes_to_dict(notice)
+    def __init__(
+        self, notice: bytes | dict, thresholds: dict[str, float | int]
+    ) -> None:
+        # an already decoded notice (e.g. the payload stored in the database)
+        # is used as is, only raw kafka bytes need to be parsed
+        self.gw_dict = notice if isinstance(notice, dict) else bytes_to_dict(notice)
         self.thresholds = thresholds
 
         self.logger = logging.getLogger(f"gcn_stream.gw_alert_{self.event_id}")
@@ -88,7 +94,7 @@ class GW_alert:
         GW_alert
             An instance of GW_alert initialized with the database model data.
         """
-        return cls(json.dumps(db_model.payload_json).encode("utf-8"), thresholds)
+        return cls(db_model.payload_json, thresholds)
 
     @property
     def BBH_proba(self) -> float | None:
@@ -387,6 +393,32 @@ class GW_alert:
         skymap: QTable = QTable.read(io.BytesIO(skymap_bytes))
         return skymap
 
+    @cached_property
+    def _sorted_skymap(
+        self,
+    ) -> tuple[QTable, astro_units.quantity.Quantity, ndarray]:
+        """
+        Decode the skymap once and sort it by decreasing probability density.
+        The credible regions are computed from it for every credible level.
+
+        Returns
+        -------
+        tuple[QTable, Quantity, ndarray]
+            - skymap: the skymap sorted by decreasing probability density
+            - pixel_area: the area of each pixel of the sorted skymap
+            - cumprob: the cumulative probability of the sorted skymap
+        """
+        skymap = self.get_skymap()
+        skymap.sort("PROBDENSITY", reverse=True)
+        level, _ = uniq_to_level_ipix(skymap["UNIQ"])
+        pixel_area: astro_units.quantity.Quantity = nside_to_pixel_area(
+            level_to_nside(level)
+        )
+
+        prob = pixel_area * skymap["PROBDENSITY"]
+        cumprob: ndarray = cumsum(prob)
+        return skymap, pixel_area, cumprob
+
     def get_error_region(
         self, credible_level: float
     ) -> tuple[QTable, float64, float64, float64]:
@@ -409,19 +441,12 @@ class GW_alert:
             - mean_sigma_dist: the mean of the luminosity distance sigma within the sub region
         """
         assert 0 < credible_level <= 1, "credible region must be within 0 and 1"
-        skymap = self.get_skymap()
-        skymap.sort("PROBDENSITY", reverse=True)
-        level, _ = uniq_to_level_ipix(skymap["UNIQ"])
-        pixel_area: astro_units.quantity.Quantity = nside_to_pixel_area(
-            level_to_nside(level)
-        )
-
-        prob = pixel_area * skymap["PROBDENSITY"]
-        cumprob: ndarray = cumsum(prob)
+        skymap, pixel_area, cumprob = self._sorted_skymap
 
         i = cumprob.searchsorted(credible_level)
 
-        skymap_region = skymap[:i]
+        # copy the region, the caller may modify it and the sorted skymap is shared
+        skymap_region = skymap[:i].copy()
         size_region = pixel_area[:i].sum()
 
         if "DISTMU" in skymap_region.colnames:
@@ -67,9 +67,24 @@ class GCNStream:
         """
         return self._session_local
 
-    def run(self, test: bool = False, max_retries: int = 3600) -> None:
+    def run(
+        self,
+        test: bool = False,
+        max_retries: int = 3600,
+        max_empty_polls: int | None = None,
+    ) -> None:
         """
         Run the polling infinite loop of the GCN stream with periodic configuration checks
+
+        Parameters
+        ----------
+        test : bool, optional
+            If True, stop after one polling loop, by default False
+        max_retries : int, optional
+            Number of polls of one polling loop, by default 3600
+        max_empty_polls : int | None, optional
+            End the polling loop after this number of consecutive polls without
+            message, by default None (the loop always polls max_retries times)
         """
 
         gcn_consumer = Consumer(gcn_stream=self, logger=self.logger)
@@ -77,7 +92,9 @@ class GCNStream:
         self.logger.info("Starting GCN stream consumer")
         while True:
             self.logger.info("GCN stream consumer is active, waiting for messages...")
-            gcn_consumer.start_poll_loop(max_retries=max_retries)
+            gcn_consumer.start_poll_loop(
+                max_retries=max_retries, max_empty_polls=max_empty_polls
+            )
             if test:
                 break
 
@@ -18,12 +18,16 @@ from fink_utils.slack_bot.msg_builder import Message
 from grandma_gcn.slackbot.element_extension import BaseSection, MarkdownText
 
 
-def parse_swift_grb_html(trigger_id: int) -> dict[str, any]:
+def parse_swift_grb_html(
+    trigger_id: int, session: requests.Session | None = None
+) -> dict[str, any]:
     """
     Parse SWIFT BAT GRB HTML page to extract key parameters.
 
     Args:
         trigger_id: SWIFT trigger ID (e.g., 1423875)
+        session: HTTP session used to fetch the page, reusing its open
+            connections (default: a new connection for each call)
 
     Returns:
         Dictionary containing extracted parameters:
@@ -40,7 +44,8 @@ def parse_swift_grb_html(trigger_id: int) -> dict[str, any]:
     url = (
         f"https://swift.gsfc.nasa.gov/results/BATbursts/{trigger_id}/bascript/top.html"
     )
-    response = requests.get(url, timeout=30)
+    http = session if session is not None else requests
+    response = http.get(url, timeout=30)
     response.raise_for_status()
     html_content = response.text
 
@@ -1,4 +1,3 @@
-import json
 from collections.abc import Callable
 
 from fink_utils.slack_bot.msg_builder import Message
@@ -248,12 +247,10 @@ def send_grb_alert_to_slack(
 
     try:
         fallback_text = f"{grb_alert.mission.value} GRB: {grb_alert.trigger_id}"
-        blocks_json = json.dumps(msg.blocks["blocks"])
-
         response = slack_client.chat_postMessage(
             channel=channel,
             text=fallback_text,
-            blocks=blocks_json,
+            blocks=msg.blocks["blocks"],
             thread_ts=thread_ts,
         )
 
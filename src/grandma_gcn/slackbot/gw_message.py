@@ -1,4 +1,3 @@
-import json
 from collections.abc import Callable
 from pathlib import Path
 from typing import Any
@@ -552,9 +551,11 @@ def post_msg_on_slack(
     """
     try:
         for tmp_msg in msg:
-            json_p = json.dumps(tmp_msg.blocks["blocks"])
             slack_message_response = webclient.chat_postMessage(
-                channel=channel, text="msg blocks", blocks=json_p, thread_ts=thread_ts
+                channel=channel,
+                text="msg blocks",
+                blocks=tmp_msg.blocks["blocks"],
+                thread_ts=thread_ts,
             )
 
             if verbose:
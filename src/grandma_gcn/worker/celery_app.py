@@ -46,6 +46,9 @@ def initialize_celery(env_file: Path) -> Celery:
         result_serializer="json",
         timezone=config_dict["timezone"],
         enable_utc=True,
+        # gwemopt tasks run for minutes, a worker process must not reserve
+        # tasks that an idle process of the pool could start right away
+        worker_prefetch_multiplier=1,
     )
 
     return app
@@ -205,12 +205,13 @@ def push_gwemopt_product_on_owncloud(
     pattern : str
         The pattern to match files to upload. Default is "*.png".
     """
-    list_plot_path = path_gwemopt.glob(pattern)
-    for f in list_plot_path:
-        owncloud_filename = f.name
-        owncloud_client.put_file(f, owncloud_url, owncloud_filename)
+    list_plot_path = sorted(path_gwemopt.glob(pattern))
+    uploaded_urls = owncloud_client.put_many(
+        [(f, owncloud_url, f.name) for f in list_plot_path]
+    )
+    for url_file in uploaded_urls:
         owncloud_client.logger.info(
-            f"File {owncloud_filename} successfully uploaded to {owncloud_url}"
+            f"File {url_file.name} successfully uploaded to {owncloud_url}"
         )
     owncloud_client.logger.info(
         f"All gwemopt products successfully uploaded to {owncloud_url}"
@@ -401,6 +402,7 @@ def gwemopt_task(
 
                 ascii_tiles_path = output_path / "tiles_ascii.txt"
                 # Upload the tiles table in custom ASCII format to ownCloud
+                ascii_tiles_uploads = []
                 for k, v in tiles.items():
                     gwemopt_ascii_tiles = table_to_custom_ascii(k, v)
 
@@ -408,11 +410,14 @@ def gwemopt_task(
                     with open(ascii_tiles_path, "w") as f:
                         f.write(gwemopt_ascii_tiles)
 
-                    owncloud_client.put_data(
-                        data=gwemopt_ascii_tiles.encode("utf-8"),
-                        url=obs_strategy_owncloud_url_folder,
-                        owncloud_filename=f"tiles_{k}.txt",
+                    ascii_tiles_uploads.append(
+                        (
+                            gwemopt_ascii_tiles.encode("utf-8"),
+                            obs_strategy_owncloud_url_folder,
+                            f"tiles_{k}.txt",
+                        )
                     )
+                owncloud_client.put_many(ascii_tiles_uploads)
 
                 logger.info(
                     "Tiles table converted to custom ASCII format and uploaded to ownCloud."
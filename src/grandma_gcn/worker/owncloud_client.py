@@ -1,34 +1,121 @@
+import base64
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
 from yarl import URL
 
+# number of threads used to upload files or create folders in parallel
+MAX_UPLOAD_WORKERS = 8
+# number of keep-alive connections kept open per host by the client session
+POOL_MAXSIZE = 16
+
+
+class OwncloudUploadError(Exception):
+    """
+    Raised by OwncloudClient.put_many when at least one upload fails.
+
+    Attributes
+    ----------
+    failed : list[tuple[URL, Exception]]
+        The URL of each failed upload in ownCloud with its error,
+        in the same order as the items given to put_many.
+    nb_items : int
+        The number of uploads given to put_many.
+    """
+
+    def __init__(self, failed: list[tuple[URL, Exception]], nb_items: int) -> None:
+        self.failed = failed
+        self.nb_items = nb_items
+        failed_uploads = "\n".join(f" - {url}: {err!r}" for url, err in failed)
+        super().__init__(
+            f"Failed to upload {len(failed)}/{nb_items} files to ownCloud:\n{failed_uploads}"
+        )
+
+
+class _BasicAuthorization(AuthBase):
+    """
+    Set a precomputed Basic Authorization header on each request.
+
+    Setting it as the session auth also keeps requests from replacing the header
+    by a ~/.netrc entry, while the proxy and CA bundle settings are still read
+    from the environment.
+    """
+
+    def __init__(self, authorization: str) -> None:
+        self.authorization = authorization
+
+    def __call__(self, r: requests.PreparedRequest) -> requests.PreparedRequest:
+        r.headers["Authorization"] = self.authorization
+        return r
+
 
 class OwncloudClient:
     def __init__(self, config: dict[str, Any] | None) -> None:
         self.owncloud_config: dict[str, Any] = config if config is not None else {}
         self.logger = logging.getLogger("grandma_gcn.owncloud")
 
+        # resolve the connection settings once, they never change after construction
+        self._username: str | None = self.owncloud_config.get("username")
+        self._password: str | None = self.owncloud_config.get("password")
+        base_url = self.owncloud_config.get("base_url")
+        self._base_url: URL | None = URL(base_url) if base_url is not None else None
+
+        # share the keep-alive connections between the requests of the client
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=POOL_MAXSIZE)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        # encode the basic auth credentials once, the header is sent with every request
+        self._authorization: str | None = None
+        if self._username is not None and self._password is not None:
+            token = base64.b64encode(
+                f"{self._username}:{self._password}".encode()
+            ).decode()
+            self._authorization = f"Basic {token}"
+            self._session.auth = _BasicAuthorization(self._authorization)
+
     @property
     def username(self) -> str:
-        if "username" not in self.owncloud_config:
+        if self._username is None:
             raise ValueError("Username not found in ownCloud configuration.")
-        return self.owncloud_config.get("username")
+        return self._username
 
     @property
     def password(self) -> str:
-        if "password" not in self.owncloud_config:
+        if self._password is None:
             raise ValueError("Password not found in ownCloud configuration.")
-        return self.owncloud_config.get("password")
+        return self._password
 
     @property
-    def base_url(self) -> str:
-        if "base_url" not in self.owncloud_config:
+    def base_url(self) -> URL:
+        if self._base_url is None:
             raise ValueError("Base URL not found in ownCloud configuration.")
-        return URL(self.owncloud_config.get("base_url"))
+        return self._base_url
+
+    @property
+    def authorization(self) -> str:
+        self._require_credentials()
+        return self._authorization
+
+    def _require_credentials(self) -> None:
+        """
+        Check that the credentials are in the ownCloud configuration.
+
+        Raises
+        ------
+        ValueError
+            If the username or the password is missing.
+        """
+        if self._username is None:
+            raise ValueError("Username not found in ownCloud configuration.")
+        if self._password is None:
+            raise ValueError("Password not found in ownCloud configuration.")
 
     def mkdir(self, folder_path: str) -> URL:
         """
@@ -47,22 +134,59 @@ class OwncloudClient:
         Raises
         ------
         Exception
-            If the directory creation fails.
+            If the directory creation fails. An already existing directory
+            is not an error.
         """
+        self._require_credentials()
         folder_path = self.base_url / folder_path
-        response = requests.request(
+        response = self._session.request(
             method="MKCOL",
             url=folder_path,
-            auth=HTTPBasicAuth(self.username, self.password),
         )
-        if response.status_code not in (201, 204):
+        # 405 Method Not Allowed: the directory already exists
+        if response.status_code == 405:
+            self.logger.info(f"Directory {folder_path} already exists.")
+            return folder_path
+        if response.status_code != 201:
             self.logger.error(
                 f"Failed to create directory {folder_path}: {response.status_code}"
             )
+            raise Exception(
+                f"Failed to create directory {folder_path}: {response.status_code}"
+            )
 
         self.logger.info(f"Directory {folder_path} created successfully.")
         return folder_path
 
+    def mkdir_many(self, folder_paths: list[str]) -> list[URL]:
+        """
+        Create several directories in ownCloud in parallel.
+        The parent directories must already exist.
+
+        Parameters
+        ----------
+        folder_paths : list[str]
+            The paths of the directories to create, relative to the base URL.
+
+        Returns
+        -------
+        list[URL]
+            The URLs of the created directories, in the same order as the paths.
+
+        Raises
+        ------
+        Exception
+            If the creation of one of the directories fails, once all the
+            creations have been attempted.
+        """
+        if len(folder_paths) == 0:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_UPLOAD_WORKERS, len(folder_paths))
+        ) as executor:
+            return list(executor.map(self.mkdir, folder_paths))
+
     def put_data(self, data: bytes, url: URL, owncloud_filename: str) -> URL:
         """
         Upload data to ownCloud.
@@ -86,11 +210,11 @@ class OwncloudClient:
         Exception
             If the file upload fails.
         """
+        self._require_credentials()
         url_file = url / owncloud_filename
-        response = requests.put(
+        response = self._session.put(
             url_file,
             data=data,
-            auth=HTTPBasicAuth(self.username, self.password),
             timeout=5,
         )
         if response.status_code not in (201, 204):
@@ -125,6 +249,56 @@ class OwncloudClient:
             data = f.read()
         return self.put_data(data, url, owncloud_filename)
 
+    def put_many(self, items: list[tuple[bytes | Path, URL, str]]) -> list[URL]:
+        """
+        Upload several files or data to ownCloud in parallel.
+
+        Parameters
+        ----------
+        items : list[tuple[bytes | Path, URL, str]]
+            The uploads to perform, each item is a tuple (data or local file path,
+            URL of the ownCloud directory, ownCloud filename).
+
+        Returns
+        -------
+        list[URL]
+            The URLs of the uploaded files in ownCloud, in the same order as the items.
+
+        Raises
+        ------
+        OwncloudUploadError
+            If at least one upload fails, once all the uploads have been attempted.
+            It lists the URL and the error of every failed upload.
+        """
+
+        def _put(item: tuple[bytes | Path, URL, str]) -> URL | Exception:
+            data, url, owncloud_filename = item
+            try:
+                if isinstance(data, Path):
+                    return self.put_file(data, url, owncloud_filename)
+                return self.put_data(data, url, owncloud_filename)
+            except Exception as e:
+                self.logger.error(f"Failed to upload {owncloud_filename} to {url}: {e}")
+                return e
+
+        if len(items) == 0:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_UPLOAD_WORKERS, len(items))
+        ) as executor:
+            results = list(executor.map(_put, items))
+
+        failed = [
+            (url / owncloud_filename, res)
+            for (_, url, owncloud_filename), res in zip(items, results)
+            if isinstance(res, Exception)
+        ]
+        if len(failed) > 0:
+            raise OwncloudUploadError(failed, len(items)) from failed[0][1]
+
+        return results
+
     def get_url_subpart(self, url: URL, nb_part: int) -> str:
         """
         Get a subpart of the URL.
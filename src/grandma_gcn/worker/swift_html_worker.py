@@ -6,27 +6,82 @@ trigger is received, allowing time for the HTML analysis page to be generated
 on the SWIFT website.
 """
 
-import json
+import threading
 from pathlib import Path
 
 import requests
 from celery import current_task
+from celery.signals import worker_process_init
 from fink_utils.slack_bot.bot import init_slackbot
+from requests.adapters import HTTPAdapter
+from slack_sdk import WebClient
 
 from grandma_gcn.parse_swift_html import format_swift_message, parse_swift_grb_html
 from grandma_gcn.worker.celery_app import celery
 from grandma_gcn.worker.gwemopt_worker import setup_task_logger
 
 
+def new_http_session() -> requests.Session:
+    """
+    Create the HTTP session used to fetch the SWIFT analysis pages.
+
+    Returns:
+        requests.Session: session keeping its connections alive between the tasks
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+    return session
+
+
+_SESSION = new_http_session()
+
+# retry policy of the SWIFT analysis task: exponential backoff with full jitter
+# so that the workers don't retry in lockstep after a SWIFT website outage,
+# applied by the autoretry of the task
+SWIFT_MAX_RETRIES = 3
+SWIFT_RETRY_BACKOFF = 60  # in seconds, first retry window
+SWIFT_RETRY_BACKOFF_MAX = 1800  # in seconds
+
+
+@worker_process_init.connect
+def reset_http_session(**kwargs):
+    """
+    Give each forked worker process its own HTTP session, the connection pool
+    of the parent process must not be shared with the children.
+    """
+    global _SESSION
+    _SESSION = new_http_session()
+
+
+_SLACK_CLIENT: WebClient | None = None
+_SLACK_CLIENT_LOCK = threading.Lock()
+
+
+def get_slack_client() -> WebClient:
+    """
+    Get the Slack client of the worker process, built on the first call.
+
+    The lock keeps the threads of a worker from building their own client.
+
+    Returns:
+        WebClient: Slack client shared by the tasks of the worker process
+    """
+    global _SLACK_CLIENT
+    with _SLACK_CLIENT_LOCK:
+        if _SLACK_CLIENT is None:
+            _SLACK_CLIENT = init_slackbot()
+        return _SLACK_CLIENT
+
+
 @celery.task(
     name="fetch_and_post_swift_analysis",
     bind=True,
     autoretry_for=(Exception,),
-    retry_kwargs={
-        "max_retries": 3,
-        "countdown": 300,
-    },  # Retry up to 3 times, wait 5 min between retries
-    retry_backoff=True,
+    max_retries=SWIFT_MAX_RETRIES,
+    retry_kwargs={"max_retries": SWIFT_MAX_RETRIES},
+    retry_backoff=SWIFT_RETRY_BACKOFF,
+    retry_backoff_max=SWIFT_RETRY_BACKOFF_MAX,
+    retry_jitter=True,
 )
 def fetch_and_post_swift_analysis(
     self,
@@ -59,7 +114,7 @@ def fetch_and_post_swift_analysis(
     logger.info(f"Fetching SWIFT HTML analysis for trigger {trigger_id}")
 
     try:
-        params = parse_swift_grb_html(trigger_id)
+        params = parse_swift_grb_html(trigger_id, session=_SESSION)
 
         if not any(
             params.get(key) for key in ["t90", "hardness_ratio", "fluence_15_150"]
@@ -75,17 +130,17 @@ def fetch_and_post_swift_analysis(
             logger.warning(f"Empty message generated for trigger {trigger_id}")
             return
 
-        slack_client = init_slackbot()
+        slack_client = get_slack_client()
 
         logger.info(
             f"Posting SWIFT analysis to Slack channel {channel}, thread {thread_ts}"
         )
 
-        blocks_json = json.dumps(msg.blocks["blocks"])
+        # slack_sdk serializes the list of blocks itself with the request body
         response = slack_client.chat_postMessage(
             channel=channel,
             text=f"SWIFT BAT Detailed Analysis for trigger {trigger_id}",
-            blocks=blocks_json,
+            blocks=msg.blocks["blocks"],
             thread_ts=thread_ts,
         )
 
@@ -136,7 +191,7 @@ def test_swift_html_parsing(self, trigger_id: int, path_log: str):
     logger.info(f"Testing SWIFT HTML parsing for trigger {trigger_id}")
 
     try:
-        params = parse_swift_grb_html(trigger_id)
+        params = parse_swift_grb_html(trigger_id, session=_SESSION)
         msg = format_swift_message(params)
 
         logger.info(f"Parsed parameters: {params}")
@@ -1,4 +1,5 @@
 import pickle
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -12,16 +13,43 @@ from grandma_gcn.gcn_stream.grb_alert import GRB_alert, Mission
 from grandma_gcn.gcn_stream.gw_alert import GW_alert
 
 
-@pytest.fixture
-def sqlite_engine_and_session(tmp_path):
-    db_path = tmp_path / "testdb.sqlite"
+@pytest.fixture(scope="session")
+def sqlite_engine(tmp_path_factory):
+    """
+    SQLite engine shared by the whole test session, the schema is created once.
+    """
+    db_path = tmp_path_factory.mktemp("db") / "testdb.sqlite"
     engine = sqlalchemy.create_engine(
         f"sqlite:///{db_path}", connect_args={"check_same_thread": False}
     )
+
+    @sqlalchemy.event.listens_for(engine, "connect")
+    def _no_durability(dbapi_connection, connection_record):
+        # the test database is thrown away, no need to fsync on every commit
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.close()
+
     GWBase.metadata.create_all(engine)
     GRBBase.metadata.create_all(engine)
-    Session = sqlalchemy.orm.sessionmaker(bind=engine)
-    return engine, Session
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_engine_and_session(sqlite_engine):
+    """
+    The tables are emptied at the end of each test, each test starts with an
+    empty database.
+    """
+    Session = sqlalchemy.orm.sessionmaker(bind=sqlite_engine)
+    yield sqlite_engine, Session
+    sqlalchemy.orm.close_all_sessions()
+    with sqlite_engine.begin() as conn:
+        for metadata in (GWBase.metadata, GRBBase.metadata):
+            for table in reversed(metadata.sorted_tables):
+                conn.execute(table.delete())
 
 
 @pytest.fixture(autouse=True)
@@ -37,7 +65,7 @@ def set_fake_slack_token(monkeypatch, request):
         yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def logger():
     """
     Fixture to initialize the logger
@@ -45,7 +73,7 @@ def logger():
     return init_logging()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gcn_config_path():
     """
     Fixture to provide the path to the GCN configuration file
@@ -53,19 +81,22 @@ def gcn_config_path():
     return Path("tests/gcn_stream_test.toml")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def path_tests():
     basedir = Path.absolute(Path(__file__).parents[1])
     return Path(basedir, "tests")
 
 
+@lru_cache(maxsize=None)
 def open_notice_file(path_test, name_file):
-    path_notice = Path(path_test, "notice_examples", name_file)
-    with open(path_notice, "rb") as fp:
-        return fp.read()
+    """
+    Read a notice file from the notice_examples folder.
+    The bytes are cached, each notice file is read only once per test session.
+    """
+    return Path(path_test, "notice_examples", name_file).read_bytes()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def threshold_config() -> dict[str, float]:
     """
     Fixture to provide the threshold configuration for GW alerts
@@ -78,19 +109,19 @@ def threshold_config() -> dict[str, float]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gw_alert_unsignificant(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "gw_notice_unsignificant.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gw_alert_significant(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "gw_notice_significant.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def S241102_initial(
     path_tests,
 ) -> GW_alert:
@@ -104,25 +135,25 @@ def S241102_initial(
     return GW_alert(bytes_notice, thresholds=specific_thresholds)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def S241102_preliminary(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "S241102br-preliminary.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def S241102_update(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "S241102br-update.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def S250720j_update(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "S250720j-preliminary.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def S250910b_earlywarning(path_tests, threshold_config) -> GW_alert:
     bytes_notice = open_notice_file(path_tests, "S250910b-earlywarning.json")
     return GW_alert(bytes_notice, thresholds=threshold_config)
@@ -140,10 +171,14 @@ def owncloud_client(gcn_config_path, logger):
     return OwncloudClient(config.get("OWNCLOUD"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tiles() -> dict[str, Table]:
+    """
+    Tiles unpickled once per session, the tables are shared between the tests.
+    """
     # tiles contains the following telescopes: ['TCH', 'TRE', 'TCA', 'FZU-CTA-N', 'FZU-Auger']
-    tiles = pickle.load(open("tests/data/tiles.pickle", "rb"))
+    with open("tests/data/tiles.pickle", "rb") as fp:
+        tiles = pickle.load(fp)
 
     tiles["KAO"] = tiles["Colibri"] = tiles["UBAI-T60S"] = tiles["TRT-SBO"] = tiles[
         "TRT-SRO"
@@ -163,35 +198,35 @@ def patch_load_gcn_config(monkeypatch):
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def swift_bat_alert(path_tests) -> GRB_alert:
     """Swift BAT GRB alert (packet type 61)"""
     bytes_notice = open_notice_file(path_tests, "swift_bat_type61.xml")
     return GRB_alert(bytes_notice, Mission.SWIFT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def swift_xrt_alert(path_tests) -> GRB_alert:
     """Swift XRT alert (packet type 67)"""
     bytes_notice = open_notice_file(path_tests, "swift_xrt_type67.xml")
     return GRB_alert(bytes_notice, Mission.SWIFT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def swift_uvot_alert(path_tests) -> GRB_alert:
     """Swift UVOT alert (packet type 81)"""
     bytes_notice = open_notice_file(path_tests, "swift_uvot_type81.xml")
     return GRB_alert(bytes_notice, Mission.SWIFT)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def svom_eclairs_alert(path_tests) -> GRB_alert:
     """SVOM ECLAIRs alert (packet type 202)"""
     bytes_notice = open_notice_file(path_tests, "svom_eclairs.xml")
     return GRB_alert(bytes_notice, Mission.SVOM)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def svom_mxt_alert(path_tests) -> GRB_alert:
     """SVOM MXT alert (packet type 209)"""
     bytes_notice = open_notice_file(path_tests, "svom_mxt.xml")
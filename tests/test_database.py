@@ -1,7 +1,7 @@
 from unittest.mock import MagicMock
 
 import pytest
-from sqlalchemy import text
+from sqlalchemy import event, inspect, text
 
 from grandma_gcn.database.gw_db import GW_alert
 from grandma_gcn.database.init_db import init_db
@@ -52,6 +52,44 @@ def test_insert_with_none_thread_ts(sqlite_engine_and_session):
         assert alert.reception_count == 1
 
 
+def test_get_last_by_trigger_id_uses_index(sqlite_engine_and_session):
+    engine, SessionLocal = sqlite_engine_and_session
+
+    indexes = {idx["name"]: idx for idx in inspect(engine).get_indexes("gw_alerts")}
+    index = indexes["ix_gw_alerts_triggerId_reception_count"]
+    assert index["column_names"] == ["triggerId", "reception_count"]
+    assert not index["unique"]
+
+    # capture the SELECT sent by get_last_by_trigger_id
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with SessionLocal() as session:
+            GW_alert.insert_or_increment(session, "S240707c")
+            GW_alert.insert_or_increment(session, "S240707c")
+            statements.clear()
+            alert = GW_alert.get_last_by_trigger_id(session, "S240707c")
+            assert alert.reception_count == 2
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    assert len(statements) == 1
+    statement, parameters = statements[0]
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {statement}", parameters
+        ).fetchall()
+    plan_details = " ".join(row[-1] for row in plan)
+    assert "USING INDEX ix_gw_alerts_triggerId_reception_count" in plan_details
+    # the index also gives the order of the rows, no sort step is needed
+    assert "TEMP B-TREE" not in plan_details
+
+
 def test_get_or_set_thread_ts_sets_only_if_none(sqlite_engine_and_session):
     _, SessionLocal = sqlite_engine_and_session
 
@@ -14,29 +14,79 @@ This allows E2E tests to run in a real or controlled integration environment wit
 """
 
 import time
+from collections import deque
 from pathlib import Path
+from typing import NamedTuple
 from unittest.mock import MagicMock, patch
 
 from astropy.table import Table
 from numpy.random import random
 from pytest import mark
 
+from grandma_gcn.gcn_stream.stream import main
+from grandma_gcn.slackbot.gw_message import (
+    post_image_on_slack as real_post_image_on_slack,
+)
+from grandma_gcn.worker.celery_app import celery
 from tests.conftest import open_notice_file
 
 
-def push_message_for_test(mocker, message_queue: list, topic: str, notice_file: str):
+class FakeKafkaMessage(NamedTuple):
+    """
+    Kafka message returned by the mocked poll, with the accessors used by the consumer.
+    """
+
+    topic_name: str
+    offset_id: int
+    payload: bytes
+
+    def topic(self) -> str:
+        return self.topic_name
+
+    def offset(self) -> int:
+        return self.offset_id
+
+    def error(self) -> None:
+        return None
+
+    def value(self) -> bytes:
+        return self.payload
+
+
+def push_message_for_test(
+    message_queue: deque, topic: str, notice_file: str
+) -> FakeKafkaMessage:
     """
     Helper function to push a message to the mocked Kafka consumer for testing.
     """
-    mock_message = mocker.Mock()
-    mock_message.topic.return_value = topic
-    mock_message.offset.return_value = len(message_queue) + 1
-    mock_message.error.return_value = None
-    mock_message.value.return_value = open_notice_file(Path("tests"), notice_file)
+    message = FakeKafkaMessage(
+        topic, len(message_queue) + 1, open_notice_file(Path("tests"), notice_file)
+    )
+    message_queue.append(message)
+
+    return message
+
+
+def mock_kafka_consumer(mocker, message_queue: deque):
+    """
+    Helper function to mock the poll and commit methods of the Kafka consumer.
+    The poll returns the head of the message queue, the commit removes it.
+    """
+
+    def mock_poll(*args, **kwargs):
+        return message_queue[0] if message_queue else None
 
-    message_queue.append(mock_message)
+    def mock_commit(message):
+        if message_queue and message is message_queue[0]:
+            message_queue.popleft()
 
-    return mock_message
+    mock_poll_method = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=mock_poll
+    )
+    mock_commit_method = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit", side_effect=mock_commit
+    )
+    return mock_poll_method, mock_commit_method
 
 
 @mark.e2e
@@ -61,27 +111,17 @@ def test_e2e_grandma(mocker, logger):
     The owncloud url should be the WebDAV url of the owncloud instance.
     """
     # Simulate a message queue
-    message_queue = []
+    message_queue = deque()
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-preliminary.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S250720j-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S250720j-preliminary.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-initial.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-initial.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S250207bg-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S250207bg-preliminary.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-update.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-update.json")
 
     # Mock the poll method
     def mock_poll(*args, **kwargs):
@@ -93,8 +133,8 @@ def test_e2e_grandma(mocker, logger):
 
     # Mock the commit method
     def mock_commit(message):
-        if message in message_queue:
-            message_queue.remove(message)
+        if message_queue and message is message_queue[0]:
+            message_queue.popleft()
         # Simulate a delay for processing
         time.sleep(60)
 
@@ -104,8 +144,6 @@ def test_e2e_grandma(mocker, logger):
 
     path_e2e_config = "gcn_stream_config.toml"
 
-    from grandma_gcn.gcn_stream.stream import main
-
     main(path_e2e_config, True, max_retries=20)
 
     # Assertions
@@ -124,92 +162,54 @@ def test_e2e_grandma_light(mocker, logger, tiles: dict[str, Table]):
 
     This test is faster than the test_e2e_grandma as it mocks the GWEMOPT process.
     """
-    from grandma_gcn.slackbot.gw_message import (
-        post_image_on_slack as real_post_image_on_slack,
-    )
-    from grandma_gcn.worker.celery_app import celery
-
     celery.conf.update(task_always_eager=True)
 
     # Simulate a message queue
-    message_queue = []
+    message_queue = deque()
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-preliminary.json")
 
     push_message_for_test(
-        mocker,
         message_queue,
         "gcn.classic.voevent.SWIFT_BAT_QL_POS",
         "swift_bat_type61.xml",
     )
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "gw_notice_significant.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "gw_notice_significant.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-initial.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-initial.json")
 
     push_message_for_test(
-        mocker, message_queue, "gcn.notices.svom.voevent.eclairs", "svom_eclairs.xml"
+        message_queue, "gcn.notices.svom.voevent.eclairs", "svom_eclairs.xml"
     )
 
     push_message_for_test(
-        mocker,
         message_queue,
         "gcn.classic.voevent.SWIFT_XRT_POSITION",
         "swift_xrt_type67.xml",
     )
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S250207bg-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S250207bg-preliminary.json")
 
     push_message_for_test(
-        mocker,
         message_queue,
         "gcn.classic.voevent.SWIFT_UVOT_POS",
         "swift_uvot_type81.xml",
     )
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S250720j-preliminary.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "S250720j-preliminary.json")
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "gw_notice_unsignificant.json"
-    )
+    push_message_for_test(message_queue, "igwn.gwalert", "gw_notice_unsignificant.json")
 
     push_message_for_test(
-        mocker,
         message_queue,
         "gcn.notices.svom.voevent.mxt",
         "svom_mxt.xml",
     )
 
-    push_message_for_test(
-        mocker, message_queue, "igwn.gwalert", "S241102br-update.json"
-    )
-
-    # Mock the poll method
-    def mock_poll(*args, **kwargs):
-        return message_queue[0] if message_queue else None
-
-    mock_poll_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=mock_poll
-    )
-
-    # Mock the commit method
-    def mock_commit(message):
-        if message in message_queue:
-            message_queue.remove(message)
+    push_message_for_test(message_queue, "igwn.gwalert", "S241102br-update.json")
 
-    mock_commit_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit", side_effect=mock_commit
-    )
+    mock_poll_method, mock_commit_method = mock_kafka_consumer(mocker, message_queue)
 
     path_e2e_config = "gcn_stream_config.toml"
 
@@ -269,8 +269,6 @@ def test_e2e_grandma_light(mocker, logger, tiles: dict[str, Table]):
                 "grandma_gcn.worker.gwemopt_worker.post_image_on_slack",
                 side_effect=patched_post_image_on_slack,
             ) as _:
-                from grandma_gcn.gcn_stream.stream import main
-
                 # Run the GCN stream
                 main(path_e2e_config, True, max_retries=20)
 
@@ -1,19 +1,26 @@
+from collections import deque
 from unittest.mock import MagicMock, patch
 
 import pytest
 from yarl import URL
 
+from grandma_gcn.database.gw_db import GW_alert as GW_alert_DB
 from grandma_gcn.gcn_stream import stream
 from grandma_gcn.gcn_stream.consumer import Consumer
 from grandma_gcn.gcn_stream.gcn_logging import init_logging
-from tests.test_e2e import push_message_for_test
+from grandma_gcn.gcn_stream.gw_alert import GW_alert
+from grandma_gcn.gcn_stream.stream import GCNStream, load_gcn_config
+from tests.test_e2e import (
+    FakeKafkaMessage,
+    mock_kafka_consumer,
+    push_message_for_test,
+)
 
 
 def test_init_gcn_stream(sqlite_engine_and_session, gcn_config_path, logger):
     """
     Test the initialization of the GCN stream
     """
-    from grandma_gcn.gcn_stream.stream import GCNStream
 
     engine, session_local = sqlite_engine_and_session
 
@@ -33,7 +40,6 @@ def test_load_gcn_config(gcn_config_path, logger):
     """
     Test the loading of the GCN configuration
     """
-    from grandma_gcn.gcn_stream.stream import load_gcn_config
 
     config = load_gcn_config(gcn_config_path, logger=logger)
 
@@ -62,36 +68,89 @@ def mock_gcn_stream():
     return MockGCNStream()
 
 
-def test_start_poll_loop(mocker, mock_gcn_stream):
-    # Simulate a message queue
-    message_queue = []
+def test_consumer_kafka_config_defaults(mocker, mock_gcn_stream):
+    mock_kafka_init = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.__init__", return_value=None
+    )
+    mocker.patch("grandma_gcn.gcn_stream.consumer.KafkaConsumer.subscribe")
+    mock_gcn_stream.gcn_config = mock_gcn_stream.gcn_config | {
+        "KAFKA_CONFIG": {"group.id": "test_group"}
+    }
 
-    # Create a mocked message
-    mock_message = mocker.Mock()
-    mock_message.topic.return_value = "test_topic"
-    mock_message.offset.return_value = 42
-    mock_message.error.return_value = None
-    mock_message.value.return_value = b"test_message"
+    Consumer(gcn_stream=mock_gcn_stream, logger=mock_gcn_stream.logger)
 
-    # Add the mocked message to the queue
-    message_queue.append(mock_message)
+    config = mock_kafka_init.call_args.kwargs["config"]
+    assert config["enable.auto.commit"] is False
+    assert config["fetch.message.max.bytes"] == 5 * 1024 * 1024
+    assert config["group.id"] == "test_group"
 
-    # Mock the poll method
-    def mock_poll(*args, **kwargs):
-        return message_queue[0] if message_queue else None
 
-    mock_poll_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=mock_poll
+def test_init_owncloud_folders_once_per_event(mocker, mock_gcn_stream, S241102_update):
+    mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.__init__", return_value=None
     )
+    mocker.patch("grandma_gcn.gcn_stream.consumer.KafkaConsumer.subscribe")
+    consumer = Consumer(gcn_stream=mock_gcn_stream, logger=mock_gcn_stream.logger)
+    consumer.owncloud_client = MagicMock()
+    consumer.owncloud_client.mkdir.side_effect = lambda path: URL(
+        "https://owncloud.example.com"
+    ).joinpath(path)
+    consumer.owncloud_client.mkdir_many.return_value = []
+
+    _, first_url = consumer.init_owncloud_folders(S241102_update)
+    _, second_url = consumer.init_owncloud_folders(S241102_update)
+
+    # the event folder and its fixed subfolders are created by the first reception
+    consumer.owncloud_client.mkdir_many.assert_called_once()
+    mkdir_paths = [
+        call.args[0] for call in consumer.owncloud_client.mkdir.call_args_list
+    ]
+    assert mkdir_paths[0] == "Candidates/GW/S241102br"
+    assert len(mkdir_paths) == 3
+    # each reception still gets its own gwemopt folder
+    assert first_url != second_url
+    assert first_url.parent == second_url.parent
+
+
+def test_init_owncloud_folders_retried_after_failure(
+    mocker, mock_gcn_stream, S241102_update
+):
+    mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.__init__", return_value=None
+    )
+    mocker.patch("grandma_gcn.gcn_stream.consumer.KafkaConsumer.subscribe")
+    consumer = Consumer(gcn_stream=mock_gcn_stream, logger=mock_gcn_stream.logger)
+    consumer.owncloud_client = MagicMock()
+    consumer.owncloud_client.mkdir.side_effect = lambda path: URL(
+        "https://owncloud.example.com"
+    ).joinpath(path)
+    consumer.owncloud_client.mkdir_many.side_effect = [
+        Exception("Failed to create directory: 503"),
+        [],
+    ]
+
+    with pytest.raises(Exception, match="503"):
+        consumer.init_owncloud_folders(S241102_update)
+    consumer.init_owncloud_folders(S241102_update)
+
+    # the failed reception doesn't mark the event folder as created,
+    # the next reception creates the folders again
+    assert consumer.owncloud_client.mkdir_many.call_count == 2
+    mkdir_paths = [
+        call.args[0] for call in consumer.owncloud_client.mkdir.call_args_list
+    ]
+    assert mkdir_paths.count("Candidates/GW/S241102br") == 2
 
-    # Mock the commit method
-    def mock_commit(message):
-        if message in message_queue:
-            message_queue.remove(message)
 
-    mock_commit_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit", side_effect=mock_commit
-    )
+def test_start_poll_loop(mocker, mock_gcn_stream):
+    # Simulate a message queue
+    message_queue = deque()
+
+    # Add a fake message to the queue
+    message = FakeKafkaMessage("test_topic", 42, b"test_message")
+    message_queue.append(message)
+
+    mock_poll_method, mock_commit_method = mock_kafka_consumer(mocker, message_queue)
 
     # Mock the process_alert method
     mock_process_alert = mocker.patch(
@@ -106,48 +165,58 @@ def test_start_poll_loop(mocker, mock_gcn_stream):
 
     # Assertions
     assert mock_poll_method.call_count == 2
-    mock_commit_method.assert_called_once_with(mock_message)
+    mock_commit_method.assert_called_once_with(message)
     mock_process_alert.assert_called_once_with(
-        notice=mock_message.value.return_value, topic=mock_message.topic.return_value
+        notice=b"test_message", topic="test_topic"
     )
     assert len(message_queue) == 0
 
 
+def test_start_poll_loop_stops_after_empty_polls(mocker, mock_gcn_stream):
+    max_empty_polls = 3
+    first_message = FakeKafkaMessage("test_topic", 1, b"first_message")
+    message = FakeKafkaMessage("test_topic", 2, b"test_message")
+    # two empty polls between the messages don't stop the loop, the counter is
+    # reset by the second message, then the loop stops after max_empty_polls
+    poll_results = [first_message, None, None, message] + [None] * max_empty_polls
+    mock_poll_method = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=poll_results
+    )
+    mock_commit_method = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit"
+    )
+    mock_process_alert = mocker.patch(
+        "grandma_gcn.gcn_stream.consumer.Consumer.process_alert"
+    )
+
+    consumer = Consumer(gcn_stream=mock_gcn_stream, logger=mock_gcn_stream.logger)
+    consumer.start_poll_loop(
+        interval_between_polls=1, max_retries=100, max_empty_polls=max_empty_polls
+    )
+
+    # the loop stops right after max_empty_polls polls following the last message
+    nb_polls_until_last_message = poll_results.index(message) + 1
+    assert mock_poll_method.call_count - nb_polls_until_last_message == max_empty_polls
+    assert mock_commit_method.call_args_list == [
+        mocker.call(first_message),
+        mocker.call(message),
+    ]
+    assert mock_process_alert.call_count == 2
+
+
 def test_gcn_stream_run(mocker, sqlite_engine_and_session, gcn_config_path, logger):
     """
     Test the run method of the GCN stream
     """
-    from grandma_gcn.gcn_stream.stream import GCNStream
 
     # Simulate a message queue
-    message_queue = []
-
-    # Create a mocked message
-    mock_message = mocker.Mock()
-    mock_message.topic.return_value = "test_topic"
-    mock_message.offset.return_value = 42
-    mock_message.error.return_value = None
-    mock_message.value.return_value = b"test_message"
-
-    # Add the mocked message to the queue
-    message_queue.append(mock_message)
-
-    # Mock the poll method
-    def mock_poll(*args, **kwargs):
-        return message_queue[0] if message_queue else None
-
-    mock_poll_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=mock_poll
-    )
+    message_queue = deque()
 
-    # Mock the commit method
-    def mock_commit(message):
-        if message in message_queue:
-            message_queue.remove(message)
+    # Add a fake message to the queue
+    message = FakeKafkaMessage("test_topic", 42, b"test_message")
+    message_queue.append(message)
 
-    mock_commit_method = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit", side_effect=mock_commit
-    )
+    mock_poll_method, mock_commit_method = mock_kafka_consumer(mocker, message_queue)
 
     # Mock the process_alert method
     mock_process_alert = mocker.patch(
@@ -159,14 +228,14 @@ def test_gcn_stream_run(mocker, sqlite_engine_and_session, gcn_config_path, logg
         gcn_config_path, engine, session_local, logger=logger, restart_queue=False
     )
 
-    # Run the GCN stream
-    gcn_stream.run(test=True)
+    # Run the GCN stream, stop after two polls without message
+    gcn_stream.run(test=True, max_empty_polls=2)
 
     # Assertions
-    assert mock_poll_method.call_count == 3600
-    mock_commit_method.assert_called_once_with(mock_message)
+    assert mock_poll_method.call_count == 3
+    mock_commit_method.assert_called_once_with(message)
     mock_process_alert.assert_called_once_with(
-        notice=mock_message.value.return_value, topic=mock_message.topic.return_value
+        notice=b"test_message", topic="test_topic"
     )
     assert len(message_queue) == 0
 
@@ -177,34 +246,19 @@ def test_gcn_stream_with_real_notice(
     """
     Test the run method of the GCN stream with a real notice and database persistence
     """
-    from grandma_gcn.database.gw_db import GW_alert
-    from grandma_gcn.gcn_stream.stream import GCNStream
 
     # Simulate a message queue
-    message_queue = []
+    message_queue = deque()
 
     def push_update():
         return push_message_for_test(
-            mocker, message_queue, "igwn.gwalert", "S241102br-update.json"
+            message_queue, "igwn.gwalert", "S241102br-update.json"
         )
 
     push_update()  # First alert
-    _ = push_message_for_test(mocker, message_queue, "igwn.gwalert", "retraction.json")
-
-    def mock_poll(*args, **kwargs):
-        return message_queue[0] if message_queue else None
+    _ = push_message_for_test(message_queue, "igwn.gwalert", "retraction.json")
 
-    _ = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.poll", side_effect=mock_poll
-    )
-
-    def mock_commit(message):
-        if message in message_queue:
-            message_queue.remove(message)
-
-    _ = mocker.patch(
-        "grandma_gcn.gcn_stream.consumer.KafkaConsumer.commit", side_effect=mock_commit
-    )
+    mock_kafka_consumer(mocker, message_queue)
 
     slack_ts = iter(["123.456", "789.101", "101.112"])
     mock_post_msg_on_slack = mocker.patch(
@@ -212,7 +266,7 @@ def test_gcn_stream_with_real_notice(
         side_effect=lambda *args, **kwargs: {"ts": next(slack_ts)},
     )
 
-    mock_owncloud_mkdir_request = mocker.patch("requests.request")
+    mock_owncloud_mkdir_request = mocker.patch("requests.Session.request")
     mock_owncloud_mkdir_request.return_value.status_code = 201
 
     # Celery mocks
@@ -243,9 +297,9 @@ def test_gcn_stream_with_real_notice(
         )
 
         # --- First run ---
-        gcn_stream.run(test=True)
+        gcn_stream.run(test=True, max_empty_polls=2)
 
-        alert = session.get(GW_alert, 1)
+        alert = session.get(GW_alert_DB, 1)
         assert alert is not None
         assert alert.triggerId == "S241102br"
         assert alert.thread_ts == "123.456"
@@ -257,19 +311,28 @@ def test_gcn_stream_with_real_notice(
         # Slack & OwnCloud interactions
         assert mock_post_msg_on_slack.called
         assert mock_owncloud_mkdir_request.call_count == 7
-        _, kwargs = mock_owncloud_mkdir_request.call_args
-        assert kwargs["method"] == "MKCOL"
-        assert kwargs["url"] == URL(
-            "https://owncloud.example.com/Candidates/GW/S241102br/VOEVENTS"
+        mkcol_urls = [
+            call.kwargs["url"]
+            for call in mock_owncloud_mkdir_request.call_args_list
+            if call.kwargs["method"] == "MKCOL"
+        ]
+        assert len(mkcol_urls) == 7
+        # the alert folder is created before its subfolders
+        assert mkcol_urls[0] == URL(
+            "https://owncloud.example.com/Candidates/GW/S241102br"
+        )
+        assert (
+            URL("https://owncloud.example.com/Candidates/GW/S241102br/VOEVENTS")
+            in mkcol_urls
         )
 
     with session_local() as session:
         # --- Second run (same alert) ---
         push_update()  # Push same alert again
-        gcn_stream.run(test=True)
+        gcn_stream.run(test=True, max_empty_polls=2)
 
         # --- Assertions after second alert ---
-        alert = session.get(GW_alert, 2)
+        alert = session.get(GW_alert_DB, 2)
         assert alert is not None
         assert alert.triggerId == "S241102br"
         assert alert.reception_count == 2
@@ -349,8 +412,6 @@ def test_handle_significant_alert_db_and_slack(
     and the Slack message is posted correctly.
     It also checks that the OwnCloud folder is created and the alert payload is stored correctly.
     """
-    from grandma_gcn.gcn_stream.consumer import Consumer
-    from grandma_gcn.gcn_stream.gw_alert import GW_alert
 
     # Prépare une fausse config et session
     _, SessionLocal = sqlite_engine_and_session
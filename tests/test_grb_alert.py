@@ -1,6 +1,9 @@
 """Tests for the GRB_alert class."""
 
+import grandma_gcn.gcn_stream.grb_alert as grb_alert_module
+from grandma_gcn.database.grb_db import GRB_alert as GRB_alert_DB
 from grandma_gcn.gcn_stream.grb_alert import GRB_alert, Mission
+from tests.conftest import open_notice_file
 
 
 class TestSwiftAlert:
@@ -61,6 +64,21 @@ class TestSwiftAlert:
         """Test that UVOT alerts should be processed."""
         assert swift_uvot_alert.should_process_alert() is True
 
+    def test_swift_params_extracted_once(self, mocker, path_tests):
+        """Test the VOEvent parameters are extracted once per alert."""
+        spy_top_params = mocker.spy(grb_alert_module.vp, "get_toplevel_params")
+        alert = GRB_alert(
+            open_notice_file(path_tests, "swift_bat_type61.xml"), Mission.SWIFT
+        )
+
+        # these properties all read the top-level params, each one is read twice
+        for _ in range(2):
+            assert alert.trigger_id == "1423875"
+            assert alert.packet_type == 61
+            assert alert.rate_signif == "22.0 sigma"
+
+        spy_top_params.assert_called_once_with(alert.voevent)
+
 
 class TestSvomAlert:
     """Tests for SVOM GRB alerts."""
@@ -104,7 +122,6 @@ class TestGRBAlertFromDbModel:
 
     def test_from_db_model(self, sqlite_engine_and_session, swift_bat_alert: GRB_alert):
         """Test creating GRB_alert from database model."""
-        from grandma_gcn.database.grb_db import GRB_alert as GRB_alert_DB
 
         _, Session = sqlite_engine_and_session
         session = Session()
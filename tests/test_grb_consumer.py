@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from grandma_gcn.database.grb_db import GRB_alert as GRB_alert_DB
 from grandma_gcn.gcn_stream.consumer import Consumer
 from grandma_gcn.gcn_stream.grb_alert import Mission
 from grandma_gcn.gcn_stream.stream import load_gcn_config
@@ -73,11 +74,18 @@ class TestTopicRouting:
 class TestGRBAlertProcessing:
     """Tests for _process_grb_alert method."""
 
+    @pytest.fixture(autouse=True)
+    def mock_slack(self, mocker):
+        """Mock the Slack post of the GRB alerts."""
+        return mocker.patch(
+            "grandma_gcn.gcn_stream.consumer.send_grb_alert_to_slack",
+            return_value={"ts": "1234567890.123456"},
+        )
+
     def test_process_swift_alert_saves_to_db(
         self, mock_gcn_stream, logger, path_tests, sqlite_engine_and_session
     ):
         """Test that Swift alert is saved to database."""
-        from grandma_gcn.database.grb_db import GRB_alert as GRB_alert_DB
 
         _, Session = sqlite_engine_and_session
         session = Session()
@@ -85,13 +93,8 @@ class TestGRBAlertProcessing:
 
         consumer = Consumer(gcn_stream=mock_gcn_stream, logger=logger)
 
-        with patch(
-            "grandma_gcn.gcn_stream.consumer.send_grb_alert_to_slack"
-        ) as mock_slack:
-            mock_slack.return_value = {"ts": "1234567890.123456"}
-
-            notice = open_notice_file(path_tests, "swift_bat_type61.xml")
-            consumer._process_grb_alert(notice, Mission.SWIFT)
+        notice = open_notice_file(path_tests, "swift_bat_type61.xml")
+        consumer._process_grb_alert(notice, Mission.SWIFT)
 
         result = session.query(GRB_alert_DB).filter_by(triggerId="1423875").first()
         assert result is not None
@@ -103,7 +106,6 @@ class TestGRBAlertProcessing:
         self, mock_gcn_stream, logger, path_tests, sqlite_engine_and_session
     ):
         """Test that SVOM alert is saved to database."""
-        from grandma_gcn.database.grb_db import GRB_alert as GRB_alert_DB
 
         _, Session = sqlite_engine_and_session
         session = Session()
@@ -111,13 +113,8 @@ class TestGRBAlertProcessing:
 
         consumer = Consumer(gcn_stream=mock_gcn_stream, logger=logger)
 
-        with patch(
-            "grandma_gcn.gcn_stream.consumer.send_grb_alert_to_slack"
-        ) as mock_slack:
-            mock_slack.return_value = {"ts": "1234567890.123456"}
-
-            notice = open_notice_file(path_tests, "svom_eclairs.xml")
-            consumer._process_grb_alert(notice, Mission.SVOM)
+        notice = open_notice_file(path_tests, "svom_eclairs.xml")
+        consumer._process_grb_alert(notice, Mission.SVOM)
 
         result = session.query(GRB_alert_DB).filter_by(triggerId="sb25120806").first()
         assert result is not None
@@ -1,7 +1,14 @@
 """Tests for GRB Slack message builders."""
 
+import logging
+from unittest.mock import MagicMock
+
 from grandma_gcn.gcn_stream.grb_alert import GRB_alert
-from grandma_gcn.slackbot.grb_message import build_svom_alert_msg, build_swift_alert_msg
+from grandma_gcn.slackbot.grb_message import (
+    build_svom_alert_msg,
+    build_swift_alert_msg,
+    send_grb_alert_to_slack,
+)
 
 
 def test_build_swift_alert_msg_basic(swift_bat_alert: GRB_alert):
@@ -88,3 +95,22 @@ def test_build_svom_alert_msg_mxt_update(
     )
 
     assert msg is not None
+
+
+def test_send_grb_alert_to_slack_passes_block_list(swift_bat_alert: GRB_alert):
+    """Test that the message blocks are sent as a list, not a JSON string."""
+    slack_client = MagicMock()
+
+    send_grb_alert_to_slack(
+        swift_bat_alert,
+        build_swift_alert_msg,
+        slack_client,
+        channel="#grb-alerts",
+        logger=logging.getLogger(),
+        bat_alert=swift_bat_alert,
+    )
+
+    _, kwargs = slack_client.chat_postMessage.call_args
+    assert isinstance(kwargs["blocks"], list)
+    assert len(kwargs["blocks"]) > 0
+    assert all(isinstance(block, dict) for block in kwargs["blocks"])
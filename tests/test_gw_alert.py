@@ -1,9 +1,13 @@
+import copy
+import json
+
 import pytest
 from astropy.table import Table
 from astropy.time import Time
 from numpy import inf, isinf, logical_not, mean
 
 from grandma_gcn.gcn_stream.gw_alert import GW_alert
+from tests.conftest import open_notice_file
 
 
 def test_gw_alert_unsignificant(gw_alert_unsignificant: GW_alert):
@@ -189,6 +193,7 @@ def test_flatten(S241102_update: GW_alert):
 
 def test_gw_score_terrestrial(gw_alert_significant: GW_alert):
     # For a terrestrial event, score should be 0, NO_GRANDMA
+    gw_alert_significant = copy.deepcopy(gw_alert_significant)
     gw_alert_significant.gw_dict["event"]["classification"] = {"Terrestrial": 0.99}
     score, msg, action = gw_alert_significant.gw_score()
     assert score == 0
@@ -198,6 +203,7 @@ def test_gw_score_terrestrial(gw_alert_significant: GW_alert):
 
 def test_gw_score_bbh_far_badly_localized(S241102_update: GW_alert):
     # BBH, far and badly localized, should be score 1, NO_GRANDMA
+    S241102_update = copy.deepcopy(S241102_update)
 
     S241102_update.thresholds = {
         "BBH_proba": 0.0,  # force threshold to always pass
@@ -214,6 +220,7 @@ def test_gw_score_bbh_far_badly_localized(S241102_update: GW_alert):
 
 def test_gw_score_bbh_interesting(S241102_initial: GW_alert):
     # BBH, well localized and close, should be score 2, GO_GRANDMA
+    S241102_initial = copy.deepcopy(S241102_initial)
 
     S241102_initial.thresholds = {
         "BBH_proba": 0.0,  # force threshold to always pass
@@ -230,6 +237,7 @@ def test_gw_score_bbh_interesting(S241102_initial: GW_alert):
 
 def test_gw_score_bns_extremely_interesting(S241102_initial: GW_alert):
     # Simulate a BNS, well localized and close, should be score 3, GO_GRANDMA
+    S241102_initial = copy.deepcopy(S241102_initial)
     S241102_initial.gw_dict["event"]["classification"] = {"BNS": 0.99}
 
     S241102_initial.thresholds = {
@@ -247,6 +255,7 @@ def test_gw_score_bns_extremely_interesting(S241102_initial: GW_alert):
 
 def test_gw_score_bns_interesting_far(S241102_initial: GW_alert):
     # Simulate a BNS, far or badly localized, should be score 2, GO_GRANDMA
+    S241102_initial = copy.deepcopy(S241102_initial)
     S241102_initial.gw_dict["event"]["classification"] = {"BNS": 0.99}
 
     S241102_initial.thresholds = {
@@ -264,6 +273,7 @@ def test_gw_score_bns_interesting_far(S241102_initial: GW_alert):
 
 def test_gw_score_retraction(S241102_initial: GW_alert):
     # Simulate a retraction event
+    S241102_initial = copy.deepcopy(S241102_initial)
     S241102_initial.gw_dict["alert_type"] = "RETRACTATION"
     score, msg, action = S241102_initial.gw_score()
     assert score == 0
@@ -310,3 +320,32 @@ def test_no_classification(S250720j_update: GW_alert):
     assert (
         event_class is None
     ), "Event class should be None when no classification is present"
+
+
+def test_save_notice(S241102_update: GW_alert, tmp_path):
+    path_notice = S241102_update.save_notice(tmp_path)
+
+    assert path_notice.parent == tmp_path
+    assert path_notice.suffix == ".json"
+    assert json.loads(path_notice.read_text()) == S241102_update.gw_dict
+
+
+def test_get_error_region_decodes_skymap_once(mocker, path_tests, threshold_config):
+    gw_alert = GW_alert(
+        open_notice_file(path_tests, "S241102br-update.json"),
+        thresholds=threshold_config,
+    )
+    spy_get_skymap = mocker.spy(gw_alert, "get_skymap")
+
+    region_90, size_90, mean_dist, _ = gw_alert.get_error_region(0.9)
+    region_50, size_50, _, _ = gw_alert.get_error_region(0.5)
+    # the returned regions are copies, modifying them keeps the cache intact
+    region_90.sort("UNIQ")
+    region_90_bis, size_90_bis, mean_dist_bis, _ = gw_alert.get_error_region(0.9)
+
+    spy_get_skymap.assert_called_once()
+    assert size_50 < size_90 == size_90_bis
+    assert mean_dist == mean_dist_bis
+    assert list(region_90_bis["PROBDENSITY"]) == sorted(
+        region_90_bis["PROBDENSITY"], reverse=True
+    )
@@ -29,6 +29,25 @@ def test_gw_alert_from_db_model_minimal():
     assert alert.gracedb_url == "url"
 
 
+def test_gw_alert_from_db_model_does_not_reserialize(mocker):
+    payload = {
+        "superevent_id": "S1",
+        "event": {"significant": True},
+        "alert_type": "PRELIMINARY",
+        "urls": {"gracedb": "url"},
+    }
+    db_model = DBGWAlert(payload_json=payload)
+    mock_dumps = mocker.patch("grandma_gcn.gcn_stream.gw_alert.json.dumps")
+    mock_loads = mocker.patch("grandma_gcn.gcn_stream.gw_alert.json.loads")
+
+    alert = GW_alert.from_db_model(db_model, {})
+
+    mock_dumps.assert_not_called()
+    mock_loads.assert_not_called()
+    assert alert.gw_dict is payload
+    assert alert.event_id == "S1"
+
+
 def make_db_model_from_notice_bytes(session, notice_bytes: bytes) -> DBGWAlert:
     # Load JSON from bytes and store as a JSON string in the DB
     notice_dict = json.load(io.BytesIO(notice_bytes))
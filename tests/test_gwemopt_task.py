@@ -1,5 +1,4 @@
 import logging
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -7,6 +6,7 @@ import pytest
 from astropy.table import Table
 from yarl import URL
 
+from grandma_gcn.database.gw_db import GW_alert as GWDB_alert
 from grandma_gcn.gcn_stream.gw_alert import GW_alert
 from grandma_gcn.gcn_stream.stream import load_gcn_config
 from grandma_gcn.worker.celery_app import celery
@@ -21,6 +21,10 @@ def celery_eager():
     celery.conf.update(task_always_eager=True)
 
 
+def test_celery_worker_prefetch_one_task():
+    assert celery.conf.worker_prefetch_multiplier == 1
+
+
 def test_init_gwemopt_basic(gw_alert_unsignificant: GW_alert):
     nside = 16
     flat_map = gw_alert_unsignificant.flatten_skymap(nside)
@@ -175,108 +179,97 @@ def test_init_gwemopt_S241102_update(S241102_update: GW_alert):
 
 
 def test_gwemopt_task_celery(
-    mocker, S241102_update, sqlite_engine_and_session, tiles: dict[str, Table]
+    mocker, S241102_update, sqlite_engine_and_session, tiles: dict[str, Table], tmp_path
 ):
-    with tempfile.TemporaryDirectory() as tmp_path:
-        tmp_path = Path(tmp_path)
-        telescopes = ["TCH", "TRE"]
-        nb_tiles = [10, 10]
-        nside = 16
-        path_output = tmp_path / "output"
-        path_output.mkdir(parents=True, exist_ok=True)
-        BBH_threshold = 0.5
-        Distance_threshold = 500
-        ErrorRegion_threshold = 500
-
-        mock_owncloud_mkdir_request = mocker.patch("requests.request")
-        mock_owncloud_mkdir_request.return_value.status_code = 201
-
-        mock_owncloud_put_file = mocker.patch("requests.put")
-        mock_owncloud_put_file.return_value.status_code = 201
-
-        from grandma_gcn.database.gw_db import GW_alert as GWDB_alert
-
-        engine, sessionmaker_ = sqlite_engine_and_session
-        session = sessionmaker_()
-        gw_alert_db = gw_alert_db = GWDB_alert(
-            triggerId=S241102_update.event_id,
-            thread_ts=None,
-            reception_count=1,
-            payload_json=S241102_update.gw_dict,
-            owncloud_url="https://owncloud.example.com/fake1",
-            message_ts="123.456",
-            is_process_running=False,
-        )
-        session.add(gw_alert_db)
-        session.commit()
-        id_gw_alert_db = gw_alert_db.id_gw
-        session.close()
+    telescopes = ["TCH", "TRE"]
+    nb_tiles = [10, 10]
+    nside = 16
+    path_output = tmp_path / "output"
+    path_output.mkdir(parents=True, exist_ok=True)
+    BBH_threshold = 0.5
+    Distance_threshold = 500
+    ErrorRegion_threshold = 500
+
+    mock_owncloud_mkdir_request = mocker.patch("requests.Session.request")
+    mock_owncloud_mkdir_request.return_value.status_code = 201
+
+    mock_owncloud_put_file = mocker.patch("requests.Session.put")
+    mock_owncloud_put_file.return_value.status_code = 201
+
+    _, sessionmaker_ = sqlite_engine_and_session
+    session = sessionmaker_()
+    gw_alert_db = gw_alert_db = GWDB_alert(
+        triggerId=S241102_update.event_id,
+        thread_ts=None,
+        reception_count=1,
+        payload_json=S241102_update.gw_dict,
+        owncloud_url="https://owncloud.example.com/fake1",
+        message_ts="123.456",
+        is_process_running=False,
+    )
+    session.add(gw_alert_db)
+    session.commit()
+    id_gw_alert_db = gw_alert_db.id_gw
+    session.close()
+
+    with patch(
+        "grandma_gcn.gcn_stream.gw_alert.Observation_plan_multiple"
+    ) as mock_obs_plan:
+        mock_obs_plan.return_value = (tiles, MagicMock())
 
         with patch(
-            "grandma_gcn.gcn_stream.gw_alert.Observation_plan_multiple"
-        ) as mock_obs_plan:
-            mock_obs_plan.return_value = (tiles, MagicMock())
+            "grandma_gcn.worker.gwemopt_worker.setup_task_logger"
+        ) as mock_logger:
+            mock_logger.return_value = (logging.getLogger(), Path("fake_path_log"))
 
             with patch(
-                "grandma_gcn.worker.gwemopt_worker.setup_task_logger"
-            ) as mock_logger:
-                mock_logger.return_value = (logging.getLogger(), Path("fake_path_log"))
-
+                "grandma_gcn.worker.celery_app.get_session_local"
+            ) as mock_get_session_local:
+                mock_get_session_local.return_value = sessionmaker_
                 with patch(
-                    "grandma_gcn.worker.celery_app.get_session_local"
-                ) as mock_get_session_local:
-                    mock_get_session_local.return_value = sessionmaker_
+                    "grandma_gcn.worker.gwemopt_worker.new_alert_on_slack"
+                ) as mock_new_alert:
                     with patch(
-                        "grandma_gcn.worker.gwemopt_worker.new_alert_on_slack"
-                    ) as mock_new_alert:
-                        with patch(
-                            "grandma_gcn.worker.gwemopt_worker.post_image_on_slack"
-                        ) as mock_post_image:
-                            mock_post_image.return_value = {
-                                "ok": True,
-                                "file": {"permalink_public": "https://fake_url"},
-                            }
-                            mock_new_alert.return_value = {"ts": "dummy_ts"}
-
-                            from sqlalchemy import inspect
-
-                            print("\n\n\n#########################")
-                            print("DB URL in test:", engine.url)
-                            print(inspect(engine).get_table_names())
-                            print("##################\n\n")
-
-                            res_gwemopt = gwemopt_task.apply(
-                                args=[
-                                    telescopes,
-                                    nb_tiles,
-                                    nside,
-                                    "#test_channel",
-                                    "CHANNELID",
-                                    {
-                                        "username": "test_user",
-                                        "password": "test_pass",
-                                        "base_url": "https://owncloud.example.com",
-                                    },
-                                    id_gw_alert_db,
-                                    str(path_output),
-                                    str(tmp_path),
-                                    {
-                                        "BBH_proba": BBH_threshold,
-                                        "Distance_cut": Distance_threshold,
-                                        "BNS_NSBH_size_cut": ErrorRegion_threshold,
-                                        "BBH_size_cut": ErrorRegion_threshold,
-                                    },
-                                    GW_alert.ObservationStrategy.TILING.value,
-                                    "thread_ts",
-                                ]
-                            )
-
-                        assert mock_obs_plan.called
-                        result = res_gwemopt.result
-                        assert isinstance(result, tuple)
-                        assert "output" in result[0]
-                        assert result[1][1].endswith("TILING_TCH_TRE")
-                        assert res_gwemopt.traceback is None
+                        "grandma_gcn.worker.gwemopt_worker.post_image_on_slack"
+                    ) as mock_post_image:
+                        mock_post_image.return_value = {
+                            "ok": True,
+                            "file": {"permalink_public": "https://fake_url"},
+                        }
+                        mock_new_alert.return_value = {"ts": "dummy_ts"}
+
+                        res_gwemopt = gwemopt_task.apply(
+                            args=[
+                                telescopes,
+                                nb_tiles,
+                                nside,
+                                "#test_channel",
+                                "CHANNELID",
+                                {
+                                    "username": "test_user",
+                                    "password": "test_pass",
+                                    "base_url": "https://owncloud.example.com",
+                                },
+                                id_gw_alert_db,
+                                str(path_output),
+                                str(tmp_path),
+                                {
+                                    "BBH_proba": BBH_threshold,
+                                    "Distance_cut": Distance_threshold,
+                                    "BNS_NSBH_size_cut": ErrorRegion_threshold,
+                                    "BBH_size_cut": ErrorRegion_threshold,
+                                },
+                                GW_alert.ObservationStrategy.TILING.value,
+                                "thread_ts",
+                            ]
+                        )
+
+                    assert mock_obs_plan.called
+                    result = res_gwemopt.result
+                    assert isinstance(result, tuple)
+                    assert "output" in result[0]
+                    assert result[1][1].endswith("TILING_TCH_TRE")
+                    assert res_gwemopt.traceback is None
 
 
 def test_process_alert_calls(
@@ -298,10 +291,10 @@ def test_process_alert_calls(
     )
     mock_post_msg_on_slack.return_value = {"ts": "dummy_ts"}
 
-    mock_owncloud_mkdir_request = mocker.patch("requests.request")
+    mock_owncloud_mkdir_request = mocker.patch("requests.Session.request")
     mock_owncloud_mkdir_request.return_value.status_code = 201
 
-    mock_owncloud_put_file = mocker.patch("requests.put")
+    mock_owncloud_put_file = mocker.patch("requests.Session.put")
     mock_owncloud_put_file.return_value.status_code = 201
 
     # Patch uuid.uuid4 to return an object with a fixed hex value
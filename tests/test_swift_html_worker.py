@@ -0,0 +1,99 @@
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from celery.exceptions import Retry
+
+import grandma_gcn.worker.swift_html_worker as swift_html_worker
+from grandma_gcn.parse_swift_html import parse_swift_grb_html
+
+
+def test_parse_swift_grb_html_uses_given_session(mocker):
+    mock_requests_get = mocker.patch("requests.get")
+    session = MagicMock(spec=requests.Session)
+    session.get.return_value.text = (
+        "<html><body><pre>T90:   12.345 +/-   1.234 sec</pre></body></html>"
+    )
+
+    params = parse_swift_grb_html(1423875, session=session)
+
+    session.get.assert_called_once_with(
+        "https://swift.gsfc.nasa.gov/results/BATbursts/1423875/bascript/top.html",
+        timeout=30,
+    )
+    session.get.return_value.raise_for_status.assert_called_once()
+    mock_requests_get.assert_not_called()
+    assert params["t90"] == 12.345
+    assert params["t90_error"] == 1.234
+
+
+def test_parse_swift_grb_html_without_session(mocker):
+    mock_requests_get = mocker.patch("requests.get")
+    mock_requests_get.return_value.text = "<html><body></body></html>"
+
+    params = parse_swift_grb_html(1423875)
+
+    mock_requests_get.assert_called_once()
+    assert params["t90"] is None
+
+
+def test_http_session_keeps_connections_alive():
+    session = swift_html_worker.new_http_session()
+    adapter = session.get_adapter("https://swift.gsfc.nasa.gov")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 10
+
+
+def test_reset_http_session_replaces_session(mocker):
+    parent_session = swift_html_worker._SESSION
+    mocker.patch.object(swift_html_worker, "_SESSION", parent_session)
+
+    swift_html_worker.reset_http_session()
+
+    assert isinstance(swift_html_worker._SESSION, requests.Session)
+    assert swift_html_worker._SESSION is not parent_session
+
+
+def test_get_slack_client_built_once(mocker):
+    mocker.patch.object(swift_html_worker, "_SLACK_CLIENT", None)
+    mock_init_slackbot = mocker.patch(
+        "grandma_gcn.worker.swift_html_worker.init_slackbot"
+    )
+
+    first = swift_html_worker.get_slack_client()
+    second = swift_html_worker.get_slack_client()
+
+    mock_init_slackbot.assert_called_once_with()
+    assert first is second is mock_init_slackbot.return_value
+
+
+def test_fetch_and_post_swift_analysis_retries_on_404(mocker):
+    task = swift_html_worker.fetch_and_post_swift_analysis
+    mocker.patch.object(swift_html_worker, "current_task")
+    mocker.patch.object(
+        swift_html_worker, "setup_task_logger", return_value=(MagicMock(), None)
+    )
+    not_found = requests.exceptions.HTTPError(response=MagicMock(status_code=404))
+    mocker.patch.object(
+        swift_html_worker, "parse_swift_grb_html", side_effect=not_found
+    )
+    mock_random = mocker.patch("celery.utils.time.random")
+    mock_random.randrange.return_value = 97
+
+    # the task already retried twice, it runs eagerly so that retry raises instead
+    # of sending the task again
+    task.push_request(
+        id="swift-task-id", retries=2, is_eager=True, called_directly=False
+    )
+    try:
+        with pytest.raises(Retry) as exc_info:
+            task.run(1423875, "1234.5678", "#swift", "/tmp")
+    finally:
+        task.pop_request()
+
+    # full jitter over the 60 * 2**2 s backoff window
+    mock_random.randrange.assert_called_once_with(
+        swift_html_worker.SWIFT_RETRY_BACKOFF * 2**2 + 1
+    )
+    assert exc_info.value.when == 97
+    assert isinstance(exc_info.value.exc, requests.exceptions.HTTPError)